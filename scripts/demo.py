@@ -13,11 +13,19 @@ from __future__ import annotations
 import asyncio
 import json
 import random
+import socket
 import struct
 import sys
 import time
 from pathlib import Path
 
+import websockets
+
+try:
+    from orjson import loads
+except ImportError:  # orjson is optional — fall back to the stdlib parser
+    from json import loads
+
 # -- path fixup so we can import from src/ without installing ------------
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
@@ -28,6 +36,7 @@ from binance_sbe.config import (
     LoggingConfig,
     PublisherConfig,
 )
+from binance_sbe.eventloop import new_event_loop
 from binance_sbe.main import FeedHandlerApp, _configure_logging
 from binance_sbe.models import BestBidAsk, MsgType
 from binance_sbe.sbe_decoder import (
@@ -42,69 +51,97 @@ from binance_sbe.sbe_decoder import (
 
 _HEADER_FMT = "<HHHH"
 _BBA_BODY_FMT = "<qqbbqqqq"
+_MAX_SYMBOL_LEN = 255  # var-string length is a single uint8
+
+# Fixed exponents for the demo feed, and their matching mantissa scales
+_PRICE_EXP = -8
+_QTY_EXP = -8
+_PRICE_SCALE = 10 ** -_PRICE_EXP
+_QTY_SCALE = 10 ** -_QTY_EXP
+
+_HEADER = struct.Struct(_HEADER_FMT)
+_BBA_BODY = struct.Struct(_BBA_BODY_FMT)
+_SYMBOL_OFFSET = _HEADER.size + _BBA_BODY.size
+
+# Only these body fields change per frame; the exponents in between are fixed
+_BBA_IDS = struct.Struct("<qq")              # eventTime, bookUpdateId
+_BBA_MANTISSAS = struct.Struct("<qqqq")      # bid, bidQty, ask, askQty
+_BBA_IDS_OFFSET = _HEADER.size
+_BBA_MANTISSAS_OFFSET = _HEADER.size + _BBA_IDS.size + 2
+
+# Reusable scratch buffer — every frame is packed in place, then copied out.
+# The header and the exponents never change, so they are written once here.
+_FRAME_BUF = bytearray(_SYMBOL_OFFSET + 1 + _MAX_SYMBOL_LEN)
+_HEADER.pack_into(
+    _FRAME_BUF,
+    0,
+    _BBA_BODY.size,      # blockLength
+    TEMPLATE_BEST_BID_ASK,
+    SCHEMA_ID,
+    SCHEMA_VERSION,
+)
+_BBA_BODY.pack_into(_FRAME_BUF, _HEADER.size, 0, 0, _PRICE_EXP, _QTY_EXP, 0, 0, 0, 0)
+
+
+def _encode_var_string(symbol: str) -> bytes:
+    """Encode ``symbol`` as an SBE varString8 (uint8 length + UTF-8 bytes)."""
+    sym_bytes = symbol.encode("utf-8")
+    return bytes([len(sym_bytes)]) + sym_bytes
 
 
 def _build_best_bid_ask_frame(
-    symbol: str,
+    symbol_var: bytes,
     bid: float,
     ask: float,
     bid_qty: float,
     ask_qty: float,
     update_id: int,
 ) -> bytes:
-    """Build a binary SBE BestBidAskStreamEvent frame."""
-    price_exp = -8
-    qty_exp = -8
-
-    def to_mantissa(val: float, exp: int) -> int:
-        return int(round(val / (10.0 ** exp)))
+    """Build a binary SBE BestBidAskStreamEvent frame.
 
+    ``symbol_var`` is the pre-encoded var-string from ``_encode_var_string``.
+    """
     event_time = int(time.time() * 1_000_000)  # µs
 
-    body = struct.pack(
-        _BBA_BODY_FMT,
-        event_time,
-        update_id,
-        price_exp,
-        qty_exp,
-        to_mantissa(bid, price_exp),
-        to_mantissa(bid_qty, qty_exp),
-        to_mantissa(ask, price_exp),
-        to_mantissa(ask_qty, qty_exp),
-    )
-    header = struct.pack(
-        _HEADER_FMT,
-        len(body),           # blockLength
-        TEMPLATE_BEST_BID_ASK,
-        SCHEMA_ID,
-        SCHEMA_VERSION,
+    buf = _FRAME_BUF
+    _BBA_IDS.pack_into(buf, _BBA_IDS_OFFSET, event_time, update_id)
+    _BBA_MANTISSAS.pack_into(
+        buf,
+        _BBA_MANTISSAS_OFFSET,
+        # Prices/quantities are positive, so +0.5 and truncate == round()
+        int(bid * _PRICE_SCALE + 0.5),
+        int(bid_qty * _QTY_SCALE + 0.5),
+        int(ask * _PRICE_SCALE + 0.5),
+        int(ask_qty * _QTY_SCALE + 0.5),
     )
-    sym_bytes = symbol.encode("utf-8")
-    var_string = bytes([len(sym_bytes)]) + sym_bytes
-    return header + body + var_string
+    end = _SYMBOL_OFFSET + len(symbol_var)
+    buf[_SYMBOL_OFFSET:end] = symbol_var
+    return bytes(memoryview(buf)[:end])
 
 
 # -----------------------------------------------------------------------
 # Mock Binance SBE WebSocket server
 # -----------------------------------------------------------------------
 
+# Pre-serialised SUBSCRIBE acknowledgement (a text frame, like Binance's)
+_SUB_ACK_TMPL = '{"result":null,"id":%s}'
+
 async def _mock_ws_handler(ws):
     """Handle one WebSocket client (the feed handler)."""
-    import websockets
-
     # Wait for the SUBSCRIBE text message
     try:
         msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
         if isinstance(msg, str):
-            data = json.loads(msg)
+            data = loads(msg)
             print(f"  [mock-server] Received SUBSCRIBE: {data.get('params', [])}")
-            await ws.send(json.dumps({"result": None, "id": data.get("id", 1)}))
+            await ws.send(_SUB_ACK_TMPL % json.dumps(data.get("id", 1)))
     except Exception as e:
         print(f"  [mock-server] Subscribe handshake error: {e}")
 
     # Send fake BBO updates
     symbols = ["BTCUSDT", "ETHUSDT"]
     base_prices = {"BTCUSDT": 97_500.0, "ETHUSDT": 2_750.0}
+    symbol_vars = {sym: _encode_var_string(sym) for sym in symbols}
     update_id = 1
 
     print("  [mock-server] Streaming fake BBO data ...\n")
@@ -117,11 +154,12 @@ async def _mock_ws_handler(ws):
                 jitter = base * random.uniform(-0.002, 0.002)
                 bid = base + jitter
                 ask = bid + spread
-                bid_qty = round(random.uniform(0.1, 5.0), 8)
-                ask_qty = round(random.uniform(0.1, 5.0), 8)
+                # No round() — the frame builder already rounds to the 1e-8 mantissa
+                bid_qty = random.uniform(0.1, 5.0)
+                ask_qty = random.uniform(0.1, 5.0)
 
                 frame = _build_best_bid_ask_frame(
-                    symbol=sym,
+                    symbol_var=symbol_vars[sym],
                     bid=bid,
                     ask=ask,
                     bid_qty=bid_qty,
@@ -137,8 +175,6 @@ async def _mock_ws_handler(ws):
 
 
 async def start_mock_server(port: int):
-    import websockets
-
     server = await websockets.serve(
         _mock_ws_handler,
         "127.0.0.1",
@@ -153,7 +189,11 @@ async def start_mock_server(port: int):
 # -----------------------------------------------------------------------
 
 _ENVELOPE_FMT = "<BH"
-_ENVELOPE_SIZE = 3
+_ENVELOPE = struct.Struct(_ENVELOPE_FMT)
+_ENVELOPE_SIZE = _ENVELOPE.size
+# Largest envelope+payload is 3 + 0xFFFF bytes, so this always fits one
+_RECV_BUF_SIZE = 1 << 17
+_BBA_LINE_FMT = b"  %-5d  %-10s  %14.4f  %12.8f  %14.4f  %12.8f  %10d\n"
 
 
 async def run_test_client(port: int) -> None:
@@ -161,41 +201,75 @@ async def run_test_client(port: int) -> None:
     await asyncio.sleep(1.5)  # wait for publisher to be ready
 
     print(f"  [test-client] Connecting to publisher on 127.0.0.1:{port} ...")
-    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setblocking(False)
+        await loop.sock_connect(sock, ("127.0.0.1", port))
+    except BaseException:
+        sock.close()
+        raise
     print("  [test-client] Connected!  Displaying feed:\n")
     print(f"  {'#':<5s}  {'Symbol':<10s}  {'Bid':>14s}  {'BidQty':>12s}  {'Ask':>14s}  {'AskQty':>12s}  {'UpdateID':>10s}")
     print(f"  {'─'*5}  {'─'*10}  {'─'*14}  {'─'*12}  {'─'*14}  {'─'*12}  {'─'*10}")
 
+    # Rows are formatted as bytes and written once per received chunk,
+    # bypassing print()'s per-line encoding and flushing.
+    sys.stdout.flush()
+    out = bytearray()
+    stdout = sys.stdout.buffer
+
+    # Single receive buffer, filled in place by recv_into: [rpos, wpos) is
+    # unparsed data.  Payloads are handed out as memoryview slices.
+    buf = bytearray(_RECV_BUF_SIZE)
+    mv = memoryview(buf)
+    rpos = wpos = 0
+
     count = 0
     try:
         while True:
-            envelope = await reader.readexactly(_ENVELOPE_SIZE)
-            msg_type, payload_len = struct.unpack(_ENVELOPE_FMT, envelope)
-
-            if payload_len > 0:
-                payload = await reader.readexactly(payload_len)
-            else:
-                payload = b""
-
-            count += 1
-
-            if msg_type == MsgType.HEARTBEAT:
-                continue  # silent
-
-            if msg_type == MsgType.BEST_BID_ASK:
-                bba = BestBidAsk.from_bytes(payload)
-                print(
-                    f"  {count:<5d}  {bba.symbol:<10s}  "
-                    f"{bba.bid_price:>14.4f}  {bba.bid_qty:>12.8f}  "
-                    f"{bba.ask_price:>14.4f}  {bba.ask_qty:>12.8f}  "
-                    f"{bba.update_id:>10d}"
-                )
-    except asyncio.IncompleteReadError:
-        pass
+            n = await loop.sock_recv_into(sock, mv[wpos:])
+            if n == 0:
+                break
+            wpos += n
+
+            # Parse every complete envelope+payload currently buffered
+            while wpos - rpos >= _ENVELOPE_SIZE:
+                msg_type, payload_len = _ENVELOPE.unpack_from(buf, rpos)
+                end = rpos + _ENVELOPE_SIZE + payload_len
+                if end > wpos:
+                    break  # partial message — wait for more bytes
+                payload = mv[rpos + _ENVELOPE_SIZE:end]
+                rpos = end
+
+                count += 1
+
+                if msg_type == MsgType.HEARTBEAT:
+                    continue  # silent
+
+                if msg_type == MsgType.BEST_BID_ASK:
+                    bba = BestBidAsk.from_bytes(payload)
+                    out += _BBA_LINE_FMT % (
+                        count, bba.symbol.encode(),
+                        bba.bid_price, bba.bid_qty,
+                        bba.ask_price, bba.ask_qty,
+                        bba.update_id,
+                    )
+
+            # Move any partial message to the front of the buffer
+            if rpos:
+                mv[:wpos - rpos] = mv[rpos:wpos]
+                wpos -= rpos
+                rpos = 0
+
+            if out:
+                stdout.write(out)
+                stdout.flush()
+                out.clear()
     except asyncio.CancelledError:
         pass
     finally:
-        writer.close()
+        sock.close()
 
 
 # -----------------------------------------------------------------------
@@ -238,22 +312,17 @@ async def main() -> None:
 
     app = FeedHandlerApp(config)
 
-    # 3. Run feed handler + test client concurrently
-    app_task = asyncio.create_task(app.run())
-    client_task = asyncio.create_task(run_test_client(PUBLISHER_TCP_PORT))
-
-    print(f"  [demo] Feed handler started.  Press Ctrl+C to stop.\n")
-
+    # 3. Run feed handler + test client concurrently.  On Ctrl+C the task
+    #    group cancels both and waits for them; app.run() shuts itself down.
     try:
-        await asyncio.gather(app_task, client_task)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(app.run())
+            tg.create_task(run_test_client(PUBLISHER_TCP_PORT))
+            print(f"  [demo] Feed handler started.  Press Ctrl+C to stop.\n")
     except asyncio.CancelledError:
         pass
-    except KeyboardInterrupt:
-        pass
     finally:
         print("\n\n  [demo] Shutting down ...")
-        client_task.cancel()
-        await app.shutdown()
         mock_server.close()
         await mock_server.wait_closed()
         print("  [demo] Done.\n")
@@ -261,6 +330,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n  Bye!")
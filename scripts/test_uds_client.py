@@ -10,12 +10,27 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import json
+import socket
+import struct
 import sys
 
+try:
+    from orjson import loads
+except ImportError:  # orjson is optional — fall back to the stdlib parser
+    from json import loads
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 BOOK_TICKER_UDS_PATH = "/tmp/binance_book_ticker.sock"
 ROLLING_TICKER_UDS_PATH = "/tmp/binance_rolling_ticker.sock"
 
+# 4-byte big-endian payload length prefix
+_LEN = struct.Struct("!I")
+_RECV_BUF_SIZE = 1 << 16
+
 STREAMS = {
     "book": BOOK_TICKER_UDS_PATH,
     "rolling": ROLLING_TICKER_UDS_PATH,
@@ -25,20 +40,65 @@ STREAMS = {
 async def listen(name: str, uds_path: str) -> None:
     """Connect to a single UDS socket and print every frame."""
     print(f"[{name}] Connecting to {uds_path} ...")
-    reader, writer = await asyncio.open_unix_connection(uds_path)
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.setblocking(False)
+        await loop.sock_connect(sock, uds_path)
+    except BaseException:
+        sock.close()
+        raise
     print(f"[{name}] Connected!\n")
 
+    # Single receive buffer, filled in place by recv_into: [rpos, wpos) is
+    # unparsed data.  It only grows if a frame is larger than the buffer.
+    buf = bytearray(_RECV_BUF_SIZE)
+    mv = memoryview(buf)
+    rpos = wpos = 0
+
+    # Lines are collected per receive and written to the binary stdout in
+    # one go, rather than one print() (encode + flush) per frame.
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+    prefix = f"  [{name}] "
+
     try:
         while True:
-            length_bytes = await reader.readexactly(4)
-            length = int.from_bytes(length_bytes, "big")
-            data = await reader.readexactly(length)
-            msg = json.loads(data)
-            print(f"  [{name}] {msg}")
-    except (asyncio.IncompleteReadError, ConnectionResetError):
-        print(f"[{name}] Connection closed.")
+            n = await loop.sock_recv_into(sock, mv[wpos:])
+            if n == 0:
+                break
+            wpos += n
+
+            lines: list[str] = []
+            while wpos - rpos >= _LEN.size:
+                (length,) = _LEN.unpack_from(buf, rpos)
+                end = rpos + _LEN.size + length
+                if end > wpos:
+                    break  # partial frame — wait for more bytes
+                msg = loads(buf[rpos + _LEN.size:end])
+                rpos = end
+                lines.append(f"{prefix}{msg}\n")
+
+            if lines:
+                stdout.write("".join(lines).encode())
+                stdout.flush()
+
+            # Move any partial frame to the front, growing for oversized ones
+            if rpos:
+                mv[:wpos - rpos] = mv[rpos:wpos]
+                wpos -= rpos
+                rpos = 0
+            if wpos >= _LEN.size:
+                needed = _LEN.size + _LEN.unpack_from(buf, 0)[0]
+                if needed > len(buf):
+                    mv.release()
+                    buf.extend(bytes(needed - len(buf)))
+                    mv = memoryview(buf)
+    except ConnectionResetError:
+        pass
     finally:
-        writer.close()
+        sock.close()
+    print(f"[{name}] Connection closed.")
 
 
 async def main(selected: list[str]) -> None:
@@ -73,6 +133,9 @@ if __name__ == "__main__":
         selected = list(STREAMS.keys())
 
     try:
-        asyncio.run(main(selected))
+        if uvloop is not None:
+            uvloop.run(main(selected))
+        else:
+            asyncio.run(main(selected))
     except KeyboardInterrupt:
         print("\nStopped.")
\ No newline at end of file
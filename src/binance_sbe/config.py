@@ -8,6 +8,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass(frozen=True, slots=True)
 class BinanceConfig:
@@ -27,6 +32,8 @@ class ConnectionConfig:
 @dataclass(frozen=True, slots=True)
 class PublisherConfig:
     uds_path: str = "/tmp/binance_feed.sock"
+    max_queue_size: int = 10_000  # per-client frames buffered before dropping; must be > 0
+    sndbuf_bytes: int = 1 << 20  # per-client SO_SNDBUF; 0 keeps the kernel default
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,21 +54,25 @@ def _build_dataclass(cls: type, raw: dict[str, Any] | None):
     """Construct a dataclass from a dict, ignoring unknown keys."""
     if raw is None:
         return cls()
-    valid = {f.name for f in cls.__dataclass_fields__.values()}
-    return cls(**{k: v for k, v in raw.items() if k in valid})
+    return cls(**{k: raw[k] for k in cls.__dataclass_fields__.keys() & raw.keys()})
 
 
-def load_config(path: str | None = None) -> AppConfig:
-    """Load config from YAML file.  Falls back to defaults."""
+def load_raw_config(path: str | None = None) -> dict[str, Any]:
+    """Load the YAML config file as a plain dict; empty if it is missing."""
     if path is None:
         path = str(Path(__file__).resolve().parents[2] / "config" / "config.yaml")
 
     cfg_path = Path(path)
     if not cfg_path.exists():
-        return AppConfig()
+        return {}
 
     with open(cfg_path) as fh:
-        raw: dict[str, Any] = yaml.safe_load(fh) or {}
+        return yaml.load(fh, Loader=_YamlLoader) or {}
+
+
+def load_config(path: str | None = None) -> AppConfig:
+    """Load config from YAML file.  Falls back to defaults."""
+    raw = load_raw_config(path)
 
     return AppConfig(
         binance=_build_dataclass(BinanceConfig, raw.get("binance")),
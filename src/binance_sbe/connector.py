@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from typing import Awaitable, Callable
 
 import structlog
@@ -15,35 +14,47 @@ log = structlog.get_logger(__name__)
 
 
 class BinanceConnector:
-    """Connects to Binance WebSocket Streams and dispatches text frames."""
+    """Connects to Binance WebSocket Streams and dispatches raw frames."""
 
     def __init__(
         self,
         binance_cfg: BinanceConfig,
         conn_cfg: ConnectionConfig,
-        on_text_frame: Callable[[str], Awaitable[None]],
+        on_frame: Callable[[bytes], Awaitable[None]],
     ) -> None:
         self._binance_cfg = binance_cfg
         self._conn_cfg = conn_cfg
-        self._on_text_frame = on_text_frame
+        self._on_frame = on_frame
         self._running = True
-        self._ws: websockets.WebSocketClientProtocol | None = None
+        self._ws: websockets.ClientConnection | None = None
+        self._preempt_task: asyncio.Task | None = None
+        self._stream_names = self._build_stream_names()
+        self._url = self._build_url()
 
     # ------------------------------------------------------------------
     # URL construction
     # ------------------------------------------------------------------
 
+    def _build_stream_names(self) -> tuple[str, ...]:
+        """Return each ``<symbol>@<streamName>`` once, in config order.
+
+        Symbols are lower-cased, so ``BTCUSDT`` and ``btcusdt`` in the
+        config collapse into a single stream.
+        """
+        return tuple(dict.fromkeys(
+            f"{symbol.lower()}@{stream}"
+            for symbol in self._binance_cfg.symbols
+            for stream in self._binance_cfg.streams
+        ))
+
     def _build_url(self) -> str:
         """Build the combined stream URL.
 
         Format: wss://stream.binance.com:9443/stream?streams=<s1>/<s2>/...
-        Each stream is ``<symbol>@<streamName>``.
+        Called once from ``__init__``; the config is frozen so the URL
+        never changes.
         """
-        parts: list[str] = []
-        for symbol in self._binance_cfg.symbols:
-            for stream in self._binance_cfg.streams:
-                parts.append(f"{symbol.lower()}@{stream}")
-        combined = "/".join(parts)
+        combined = "/".join(self._stream_names)
         return f"{self._binance_cfg.base_url}/stream?streams={combined}"
 
     # ------------------------------------------------------------------
@@ -55,11 +66,10 @@ class BinanceConnector:
         attempt = 0
 
         while self._running:
-            url = self._build_url()
-            log.info("connector.connecting", url=url)
+            log.info("connector.connecting", url=self._url)
             try:
                 async with websockets.connect(
-                    url,
+                    self._url,
                     ping_interval=20,
                     ping_timeout=20,
                     close_timeout=5,
@@ -68,21 +78,26 @@ class BinanceConnector:
                     attempt = 0
                     log.info("connector.connected")
 
-                    connect_time = time.monotonic()
+                    # Preemptive reconnect before the 24 h limit: a timer
+                    # closes the socket, which ends the receive loop below,
+                    # so no clock check runs per message.
                     reconnect_secs = self._conn_cfg.preemptive_reconnect_hours * 3600
-
-                    async for message in ws:
-                        # Binance JSON streams send text frames
-                        if isinstance(message, str):
-                            await self._on_text_frame(message)
-                        else:
-                            # Binary frame — log and skip for now
-                            log.debug("connector.binary_frame_skipped", size=len(message))
-
-                        # Preemptive reconnect before 24 h limit
-                        if time.monotonic() - connect_time > reconnect_secs:
-                            log.info("connector.preemptive_reconnect")
-                            break
+                    preempt_handle = asyncio.get_running_loop().call_later(
+                        reconnect_secs, self._preempt, ws,
+                    )
+
+                    try:
+                        while True:
+                            # Binance JSON streams send text frames.  Taking
+                            # them undecoded skips a UTF-8 pass — the JSON
+                            # parser validates the bytes anyway.
+                            try:
+                                message = await ws.recv(decode=False)
+                            except websockets.ConnectionClosedOK:
+                                break
+                            await self._on_frame(message)
+                    finally:
+                        preempt_handle.cancel()
 
             except asyncio.CancelledError:
                 log.info("connector.cancelled")
@@ -107,6 +122,11 @@ class BinanceConnector:
             finally:
                 self._ws = None
 
+    def _preempt(self, ws: websockets.ClientConnection) -> None:
+        """Timer callback — close the connection so ``run`` reconnects."""
+        log.info("connector.preemptive_reconnect")
+        self._preempt_task = asyncio.create_task(ws.close())
+
     async def stop(self) -> None:
         """Gracefully close the WebSocket."""
         self._running = False
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import re
+import sys
+from typing import Any, Iterable
 
 import structlog
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional — fall back to the stdlib parser
+    from json import loads as _json_loads
+
 from binance_sbe.models import BestBidAsk
 
 log = structlog.get_logger(__name__)
@@ -29,14 +35,62 @@ def _register(stream_name: str):
 
 @_register("bookTicker")
 def _decode_book_ticker(data: dict[str, Any]) -> BestBidAsk:
+    # Positional construction — field order: stream_type, symbol,
+    # order_book_update_id, bid_price, bid_qty, ask_price, ask_qty
+    return BestBidAsk(
+        "bookTicker",
+        data.get("s", ""),
+        data.get("u", 0),
+        float(data.get("b", 0)),
+        float(data.get("B", 0)),
+        float(data.get("a", 0)),
+        float(data.get("A", 0)),
+    )
+
+
+# Binance emits bookTicker frames with a fixed key order, so the common case
+# can be pulled straight out of the raw bytes without building any dicts.
+# Anything that does not match exactly goes through the regular JSON path.
+# The groups only admit ASCII symbols and plain decimals, so the int/float
+# conversions and the symbol decode below cannot fail.
+_BOOK_TICKER_RE = re.compile(
+    rb'\{"stream":"[^"@]*@bookTicker","data":\{'
+    rb'"u":(\d+),"s":"([0-9A-Za-z_-]*)",'
+    rb'"b":"(\d+(?:\.\d*)?)","B":"(\d+(?:\.\d*)?)",'
+    rb'"a":"(\d+(?:\.\d*)?)","A":"(\d+(?:\.\d*)?)"'
+    rb'\}\}'
+)
+
+
+# Raw symbol bytes -> interned str.  A feed only carries a handful of
+# symbols, so steady-state frames reuse the same str with no decode.
+_SYMBOL_CACHE: dict[bytes, str] = {}
+_SYMBOL_CACHE_MAX = 4096  # guard against unbounded growth on a bad feed
+
+
+def _symbol_str(raw_symbol: bytes) -> str:
+    symbol = _SYMBOL_CACHE.get(raw_symbol)
+    if symbol is None:
+        symbol = sys.intern(raw_symbol.decode())
+        if len(_SYMBOL_CACHE) < _SYMBOL_CACHE_MAX:
+            _SYMBOL_CACHE[raw_symbol] = symbol
+    return symbol
+
+
+def _decode_book_ticker_fast(raw: bytes) -> BestBidAsk | None:
+    """Decode a combined-stream bookTicker frame without JSON parsing."""
+    m = _BOOK_TICKER_RE.fullmatch(raw)
+    if m is None:
+        return None
+    update_id, symbol, bid, bid_qty, ask, ask_qty = m.groups()
     return BestBidAsk(
-        stream_type="bookTicker",
-        symbol=data.get("s", ""),
-        order_book_update_id=data.get("u", 0),
-        bid_price=float(data.get("b", 0)),
-        bid_qty=float(data.get("B", 0)),
-        ask_price=float(data.get("a", 0)),
-        ask_qty=float(data.get("A", 0)),
+        "bookTicker",
+        _symbol_str(symbol),
+        int(update_id),
+        float(bid),
+        float(bid_qty),
+        float(ask),
+        float(ask_qty),
     )
 
 
@@ -44,7 +98,7 @@ def _decode_book_ticker(data: dict[str, Any]) -> BestBidAsk:
 # Public API
 # ------------------------------------------------------------------
 
-def decode_json_message(raw: str) -> BestBidAsk | None:
+def decode_json_message(raw: str | bytes) -> BestBidAsk | None:
     """Parse a combined-stream JSON message and return a normalised model.
 
     Combined stream format:
@@ -53,9 +107,18 @@ def decode_json_message(raw: str) -> BestBidAsk | None:
     Returns ``None`` if the stream type is unknown or the message is
     malformed.
     """
+    if isinstance(raw, bytes):
+        event = _decode_book_ticker_fast(raw)
+        if event is not None:
+            return event
+    return _decode_json(raw)
+
+
+def _decode_json(raw: str | bytes) -> BestBidAsk | None:
+    """General path: parse the JSON and dispatch on the stream type."""
     try:
-        msg = json.loads(raw)
-    except (json.JSONDecodeError, TypeError) as exc:
+        msg = _json_loads(raw)
+    except (ValueError, TypeError) as exc:  # JSONDecodeError is a ValueError
         log.warning("decoder.json_error", error=str(exc))
         return None
 
@@ -69,7 +132,11 @@ def decode_json_message(raw: str) -> BestBidAsk | None:
     else:
         stream_type = stream_name
 
-    decoder = _DECODERS.get(stream_type)
+    # Nearly every frame is a bookTicker; skip the registry lookup for it
+    if stream_type == "bookTicker":
+        decoder = _decode_book_ticker
+    else:
+        decoder = _DECODERS.get(stream_type)
     if decoder is None:
         log.debug("decoder.unknown_stream", stream=stream_name)
         return None
@@ -78,4 +145,25 @@ def decode_json_message(raw: str) -> BestBidAsk | None:
         return decoder(data)
     except Exception as exc:
         log.warning("decoder.decode_error", stream=stream_name, error=str(exc))
-        return None
\ No newline at end of file
+        return None
+
+
+def decode_json_messages(frames: Iterable[str | bytes]) -> list[BestBidAsk]:
+    """Decode many frames at once, dropping any that decode to ``None``.
+
+    Same semantics as :func:`decode_json_message` per frame.  Each frame
+    still costs one or two decoder calls; binding them to locals only saves
+    the ``decode_json_message`` wrapper call and its global lookups.
+    """
+    fast = _decode_book_ticker_fast
+    slow = _decode_json
+    events: list[BestBidAsk] = []
+    append = events.append
+    for raw in frames:
+        event = fast(raw) if isinstance(raw, bytes) else None
+        if event is None:
+            event = slow(raw)
+            if event is None:
+                continue
+        append(event)
+    return events
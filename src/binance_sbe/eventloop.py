@@ -0,0 +1,18 @@
+"""Event loop construction — uvloop when it is installed."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a new uvloop loop, or a stock asyncio loop without uvloop.
+
+    Used as a loop factory instead of ``uvloop.install()``, which relies
+    on the event-loop policy API deprecated in recent Python versions.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
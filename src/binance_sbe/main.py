@@ -12,6 +12,7 @@ import structlog
 from binance_sbe.config import AppConfig, load_config
 from binance_sbe.connector import BinanceConnector
 from binance_sbe.decoder import decode_json_message
+from binance_sbe.eventloop import new_event_loop
 from binance_sbe.models import BestBidAsk
 from binance_sbe.publisher import Publisher
 
@@ -28,7 +29,6 @@ def _configure_logging(cfg: AppConfig) -> None:
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
 
     if cfg.logging.format == "json":
@@ -62,16 +62,16 @@ class FeedHandlerApp:
         self._connector = BinanceConnector(
             binance_cfg=config.binance,
             conn_cfg=config.connection,
-            on_text_frame=self._on_text_frame,
+            on_frame=self._on_frame,
         )
         self._connector_task: asyncio.Task | None = None
 
     # ------------------------------------------------------------------
-    # Text frame callback (hot path)
+    # Frame callback (hot path)
     # ------------------------------------------------------------------
 
-    async def _on_text_frame(self, raw: str) -> None:
-        """Called for every text WS frame from Binance."""
+    async def _on_frame(self, raw: bytes) -> None:
+        """Called with the raw payload of every WS frame from Binance."""
         event = decode_json_message(raw)
         if event is None:
             return
@@ -129,7 +129,7 @@ def main(config_path: str | None = None) -> None:
 
     app = FeedHandlerApp(config)
 
-    loop = asyncio.new_event_loop()
+    loop = new_event_loop()
 
     def _signal_handler() -> None:
         log.info("app.signal_received")
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, NamedTuple
 
 
-@dataclass(frozen=True, slots=True)
-class BestBidAsk:
-    """Best bid/ask (BBO) update — used for both SBE and JSON streams."""
+class BestBidAsk(NamedTuple):
+    """Best bid/ask (BBO) update — used for both SBE and JSON streams.
+
+    A ``NamedTuple`` rather than a frozen dataclass: one is built per
+    frame on the hot path, and tuple construction avoids the per-field
+    ``object.__setattr__`` calls of a frozen dataclass ``__init__``.
+    """
 
     stream_type: Literal["bestBidAsk", "bookTicker"] = "bookTicker"
     symbol: str = ""
@@ -17,4 +20,4 @@ class BestBidAsk:
     bid_qty: float = 0.0
     ask_price: float = 0.0
     ask_qty: float = 0.0
-    event_time: int = 0  # not present in bookTicker, kept for SBE compat
\ No newline at end of file
+    event_time: int = 0  # not present in bookTicker, kept for SBE compat
@@ -3,28 +3,102 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
-from dataclasses import asdict
+import socket
+import struct
+from dataclasses import fields
 from typing import Any
 
 import structlog
 
 from binance_sbe.config import PublisherConfig
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to the stdlib encoder
+    orjson = None
+    import json
+
 log = structlog.get_logger(__name__)
 
+# Upper bound on the bytes one client writer coalesces into a single write
+_MAX_BATCH_BYTES = 64 * 1024
+
+# 4-byte big-endian payload length prefix
+_LEN = struct.Struct(">I")
+
+# A queued frame is kept as (length prefix, payload) and only joined by the
+# transport's writelines(), so publish() never concatenates them.
+_Frame = tuple[bytes, bytes]
+
+
+class _Client:
+    """Send queue and overflow bookkeeping for one connected client."""
+
+    __slots__ = ("id", "queue", "dropped")
+
+    def __init__(self, client_id: int, queue: asyncio.Queue[_Frame]) -> None:
+        self.id = client_id
+        self.queue = queue
+        # Frames dropped in the current overflow episode (0 = not overflowing)
+        self.dropped = 0
+
+
+# Dataclass type -> field names, so _as_dict() skips asdict()'s per-call
+# field walk and deep copy (event fields are all flat primitives).
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _as_dict(event: Any) -> dict[str, Any]:
+    """Field mapping for a dict, ``NamedTuple`` or dataclass event."""
+    if isinstance(event, dict):
+        return event
+    if isinstance(event, tuple):
+        return event._asdict()
+    cls = type(event)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return {name: getattr(event, name) for name in names}
+
+
+def _serialise(event: Any) -> bytes:
+    """Encode a dict, ``NamedTuple`` or dataclass event as a UTF-8 JSON object."""
+    if orjson is not None:
+        # orjson serialises dataclasses natively — no asdict() deep copy.
+        # NamedTuples are not supported natively and go through default.
+        return orjson.dumps(event, default=_as_dict)
+    return json.dumps(_as_dict(event)).encode()
+
 
 class Publisher:
     """Publishes events over a Unix Domain Socket (UDS).
 
     Each message is framed as: [4-byte big-endian length][JSON payload].
+
+    Every client gets a bounded queue and its own writer task, so
+    ``publish`` never waits on a slow reader.  The writer coalesces
+    whatever frames are pending into a single write.  Frames for a
+    client whose queue is full are dropped; each overflow episode logs
+    one warning when it starts and one with the drop count once the
+    queue has drained.
     """
 
     def __init__(self, config: PublisherConfig) -> None:
+        if config.max_queue_size <= 0:
+            # asyncio.Queue treats maxsize <= 0 as unbounded
+            raise ValueError(
+                f"max_queue_size must be positive, got {config.max_queue_size}"
+            )
         self._uds_path = config.uds_path
+        self._max_queue_size = config.max_queue_size
+        self._sndbuf_bytes = config.sndbuf_bytes
         self._server: asyncio.AbstractServer | None = None
-        self._clients: set[asyncio.StreamWriter] = set()
+        self._clients: dict[asyncio.StreamWriter, _Client] = {}
+        self._writer_tasks: dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._next_client_id = 0
+        # Rebuilt on connect/disconnect so publish() iterates without copying
+        self._client_list: tuple[_Client, ...] = ()
 
     # ------------------------------------------------------------------
     # Client management
@@ -33,48 +107,110 @@ class Publisher:
     async def _handle_client(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
-        self._clients.add(writer)
-        log.info("publisher.client_connected", total=len(self._clients))
+        sock = writer.get_extra_info("socket")
+        if sock is not None and self._sndbuf_bytes:
+            # A larger kernel buffer absorbs bursts before drain() has to wait
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._sndbuf_bytes)
+            except OSError as exc:
+                log.warning("publisher.sndbuf_failed", error=str(exc))
+
+        self._next_client_id += 1
+        client = _Client(
+            self._next_client_id, asyncio.Queue(maxsize=self._max_queue_size)
+        )
+        self._clients[writer] = client
+        self._client_list = tuple(self._clients.values())
+        self._writer_tasks[writer] = asyncio.create_task(
+            self._writer_loop(writer, client),
+            name="publisher-writer",
+        )
+        log.info(
+            "publisher.client_connected", client=client.id, total=len(self._clients)
+        )
         try:
             # Keep connection open until client disconnects
             await reader.read()
         except Exception:
             pass
         finally:
-            self._clients.discard(writer)
+            self._remove_client(writer)
+            task = self._writer_tasks.pop(writer, None)
+            if task is not None:
+                task.cancel()
             try:
                 writer.close()
                 await writer.wait_closed()
             except Exception:
                 pass
-            log.info("publisher.client_disconnected", total=len(self._clients))
+            log.info(
+                "publisher.client_disconnected",
+                client=client.id,
+                total=len(self._clients),
+            )
+
+    async def _writer_loop(
+        self, writer: asyncio.StreamWriter, client: _Client
+    ) -> None:
+        """Send queued frames to one client, coalescing bursts."""
+        queue = client.queue
+        try:
+            while True:
+                prefix, payload = await queue.get()
+                batch = [prefix, payload]
+                size = len(prefix) + len(payload)
+                while size < _MAX_BATCH_BYTES and not queue.empty():
+                    prefix, payload = queue.get_nowait()
+                    batch += (prefix, payload)
+                    size += len(prefix) + len(payload)
+
+                writer.writelines(batch)
+                await writer.drain()
+
+                if client.dropped and queue.empty():
+                    log.warning(
+                        "publisher.client_queue_drained",
+                        client=client.id,
+                        dropped=client.dropped,
+                    )
+                    client.dropped = 0
+        except Exception as exc:
+            # Closing the writer ends the reader side in _handle_client,
+            # which removes the client.
+            log.warning(
+                "publisher.client_write_error", client=client.id, error=str(exc)
+            )
+            self._remove_client(writer)
+            writer.close()
+
+    def _remove_client(self, writer: asyncio.StreamWriter) -> None:
+        self._clients.pop(writer, None)
+        self._client_list = tuple(self._clients.values())
 
     # ------------------------------------------------------------------
     # Publish
     # ------------------------------------------------------------------
 
     async def publish(self, event: Any) -> None:
-        """Serialise and send an event to all connected clients."""
-        if not self._clients:
+        """Serialise an event and queue it for all connected clients."""
+        clients = self._client_list
+        if not clients:
             return
 
-        payload = json.dumps(asdict(event)).encode()
-        frame = len(payload).to_bytes(4, "big") + payload
-
-        dead: list[asyncio.StreamWriter] = []
-        for writer in self._clients:
-            try:
-                writer.write(frame)
-                await writer.drain()
-            except Exception:
-                dead.append(writer)
+        payload = _serialise(event)
+        frame = (_LEN.pack(len(payload)), payload)
 
-        for w in dead:
-            self._clients.discard(w)
+        for client in clients:
             try:
-                w.close()
-            except Exception:
-                pass
+                client.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                if not client.dropped:
+                    log.warning(
+                        "publisher.client_queue_full",
+                        client=client.id,
+                        max_queue_size=self._max_queue_size,
+                    )
+                client.dropped += 1
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -102,6 +238,10 @@ class Publisher:
             self._server.close()
             await self._server.wait_closed()
 
+        for task in self._writer_tasks.values():
+            task.cancel()
+        self._writer_tasks.clear()
+
         for writer in list(self._clients):
             try:
                 writer.close()
@@ -109,6 +249,7 @@ class Publisher:
             except Exception:
                 pass
         self._clients.clear()
+        self._client_list = ()
 
         if os.path.exists(self._uds_path):
             os.unlink(self._uds_path)
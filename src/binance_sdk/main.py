@@ -13,12 +13,10 @@ import signal
 import sys
 from pathlib import Path
 
-import yaml
-
-from binance_sbe.config import PublisherConfig
+from binance_sbe.config import PublisherConfig, load_raw_config
+from binance_sbe.eventloop import new_event_loop
 from binance_sbe.publisher import Publisher
 
-from .models import BookTickerEvent, RollingWindowTickerEvent
 from .websocket_streams import BinanceWebSocketClient
 
 # ──────────────────────────────────────────────────────────────────────
@@ -30,6 +28,7 @@ VALID_WINDOW_SIZES = ["1h", "4h", "1d"]
 DEFAULT_WINDOW_SIZES = ["1h"]
 DEFAULT_BOOK_TICKER_UDS_PATH = "/tmp/binance_book_ticker.sock"
 DEFAULT_ROLLING_TICKER_UDS_PATH = "/tmp/binance_rolling_ticker.sock"
+_PUBLISHER_DEFAULTS = PublisherConfig()
 
 LOG_FILE = Path(__file__).resolve().parents[2] / "binance_sdk.log"
 
@@ -60,14 +59,12 @@ def _configure_logging(level: str = "INFO") -> None:
 # ──────────────────────────────────────────────────────────────────────
 
 def _load_config(path: str | None = None) -> dict:
-    """Load YAML config; return empty dict on failure."""
-    if path is None:
-        path = str(Path(__file__).resolve().parents[2] / "config" / "config.yaml")
-    p = Path(path)
-    if not p.exists():
-        return {}
-    with open(p) as fh:
-        return yaml.safe_load(fh) or {}
+    """Load YAML config; return empty dict on failure.
+
+    Shares the loader with ``binance_sbe.config`` so both handlers read
+    the same file the same way.
+    """
+    return load_raw_config(path)
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -80,15 +77,25 @@ async def run(
     stream_url: str = WEBSOCKET_BASE_URL,
     book_ticker_uds_path: str = DEFAULT_BOOK_TICKER_UDS_PATH,
     rolling_ticker_uds_path: str = DEFAULT_ROLLING_TICKER_UDS_PATH,
+    max_queue_size: int = _PUBLISHER_DEFAULTS.max_queue_size,
+    sndbuf_bytes: int = _PUBLISHER_DEFAULTS.sndbuf_bytes,
 ) -> None:
     """Start the feed handler and run until interrupted."""
-    book_ticker_publisher = Publisher(PublisherConfig(uds_path=book_ticker_uds_path))
-    rolling_ticker_publisher = Publisher(PublisherConfig(uds_path=rolling_ticker_uds_path))
-
-    async def on_book_ticker(event: BookTickerEvent) -> None:
+    book_ticker_publisher = Publisher(PublisherConfig(
+        uds_path=book_ticker_uds_path,
+        max_queue_size=max_queue_size,
+        sndbuf_bytes=sndbuf_bytes,
+    ))
+    rolling_ticker_publisher = Publisher(PublisherConfig(
+        uds_path=rolling_ticker_uds_path,
+        max_queue_size=max_queue_size,
+        sndbuf_bytes=sndbuf_bytes,
+    ))
+
+    async def on_book_ticker(event: dict) -> None:
         await book_ticker_publisher.publish(event)
 
-    async def on_rolling_window_ticker(event: RollingWindowTickerEvent) -> None:
+    async def on_rolling_window_ticker(event: dict) -> None:
         await rolling_ticker_publisher.publish(event)
 
     client = BinanceWebSocketClient(
@@ -97,6 +104,7 @@ async def run(
         stream_url=stream_url,
         on_book_ticker=on_book_ticker,
         on_rolling_window_ticker=on_rolling_window_ticker,
+        emit="dict",  # callbacks only publish, so skip the event dataclasses
     )
 
     loop = asyncio.get_running_loop()
@@ -146,15 +154,20 @@ def main(config_path: str | None = None) -> None:
     stream_url = binance_cfg.get("base_url", WEBSOCKET_BASE_URL)
     book_ticker_uds = publisher_cfg.get("book_ticker_uds_path", DEFAULT_BOOK_TICKER_UDS_PATH)
     rolling_ticker_uds = publisher_cfg.get("rolling_ticker_uds_path", DEFAULT_ROLLING_TICKER_UDS_PATH)
+    max_queue_size = publisher_cfg.get("max_queue_size", _PUBLISHER_DEFAULTS.max_queue_size)
+    sndbuf_bytes = publisher_cfg.get("sndbuf_bytes", _PUBLISHER_DEFAULTS.sndbuf_bytes)
 
     try:
-        asyncio.run(run(
-            symbols=symbols,
-            window_sizes=window_sizes,
-            stream_url=stream_url,
-            book_ticker_uds_path=book_ticker_uds,
-            rolling_ticker_uds_path=rolling_ticker_uds,
-        ))
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(run(
+                symbols=symbols,
+                window_sizes=window_sizes,
+                stream_url=stream_url,
+                book_ticker_uds_path=book_ticker_uds,
+                rolling_ticker_uds_path=rolling_ticker_uds,
+                max_queue_size=max_queue_size,
+                sndbuf_bytes=sndbuf_bytes,
+            ))
     except KeyboardInterrupt:
         pass
 
@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import asdict
-from typing import Callable, Awaitable
+import operator
+from dataclasses import asdict, fields
+from typing import Any, Callable, Awaitable, Literal
 
 from binance_sdk_spot.spot import (
     Spot,
@@ -35,19 +36,64 @@ STREAM_URL = "wss://stream.binance.com:9443"
 # Helpers to convert SDK Pydantic models → dataclasses
 # ──────────────────────────────────────────────────────────────────────
 
+# Event field → SDK attribute, in the order the _parse_* helpers unpack them
+_BOOK_TICKER_ATTRS = {
+    "update_id": "u",
+    "symbol": "s",
+    "bid_price": "b",
+    "bid_qty": "B",
+    "ask_price": "a",
+    "ask_qty": "A",
+}
+_ROLLING_WINDOW_TICKER_ATTRS = {
+    "event_type": "e",
+    "event_time": "E",
+    "symbol": "s",
+    "price_change": "p",
+    "price_change_percent": "P",
+    "open_price": "o",
+    "high_price": "h",
+    "low_price": "l",
+    "close_price": "c",
+    "weighted_avg_price": "w",
+    "total_traded_base_volume": "v",
+    "total_traded_quote_volume": "q",
+    "statistics_open_time": "O",
+    "statistics_close_time": "C",
+    "first_trade_id": "F",
+    "last_trade_id": "L",
+    "total_num_trades": "n",
+}
+_BOOK_TICKER_FIELDS = tuple(_BOOK_TICKER_ATTRS.values())
+_ROLLING_WINDOW_TICKER_FIELDS = tuple(_ROLLING_WINDOW_TICKER_ATTRS.values())
+
+# One C-level call fetches every field of a message
+_get_book_ticker_fields = operator.attrgetter(*_BOOK_TICKER_FIELDS)
+_get_rolling_window_ticker_fields = operator.attrgetter(*_ROLLING_WINDOW_TICKER_FIELDS)
+
+
+def _get_fields(data, getter: operator.attrgetter, names: tuple[str, ...]) -> tuple:
+    """Fetch ``names`` from ``data`` in one call; missing attributes → ``None``."""
+    try:
+        return getter(data)
+    except AttributeError:
+        return tuple(getattr(data, name, None) for name in names)
+
+
 def _parse_book_ticker(data) -> BookTickerEvent:
     """Convert an SDK ``BookTickerResponse`` model into a ``BookTickerEvent``.
 
     The SDK delivers parsed Pydantic models with single-letter attributes
-    (u, s, b, B, a, A) — accessed via ``getattr``.
+    (u, s, b, B, a, A) — fetched together via ``operator.attrgetter``.
     """
+    u, s, b, B, a, A = _get_fields(data, _get_book_ticker_fields, _BOOK_TICKER_FIELDS)
     return BookTickerEvent(
-        update_id=getattr(data, "u", 0) or 0,
-        symbol=getattr(data, "s", "") or "",
-        bid_price=getattr(data, "b", "") or "",
-        bid_qty=getattr(data, "B", "") or "",
-        ask_price=getattr(data, "a", "") or "",
-        ask_qty=getattr(data, "A", "") or "",
+        update_id=u or 0,
+        symbol=s or "",
+        bid_price=b or "",
+        bid_qty=B or "",
+        ask_price=a or "",
+        ask_qty=A or "",
     )
 
 
@@ -56,27 +102,79 @@ def _parse_rolling_window_ticker(data) -> RollingWindowTickerEvent:
 
     The SDK delivers parsed Pydantic models with single-letter attributes.
     """
+    (
+        event_type,
+        event_time,
+        symbol,
+        price_change,
+        price_change_percent,
+        open_price,
+        high_price,
+        low_price,
+        close_price,
+        weighted_avg_price,
+        total_traded_base_volume,
+        total_traded_quote_volume,
+        statistics_open_time,
+        statistics_close_time,
+        first_trade_id,
+        last_trade_id,
+        total_num_trades,
+    ) = _get_fields(data, _get_rolling_window_ticker_fields, _ROLLING_WINDOW_TICKER_FIELDS)
     return RollingWindowTickerEvent(
-        event_type=getattr(data, "e", "") or "",
-        event_time=getattr(data, "E", 0) or 0,
-        symbol=getattr(data, "s", "") or "",
-        price_change=getattr(data, "p", "") or "",
-        price_change_percent=getattr(data, "P", "") or "",
-        open_price=getattr(data, "o", "") or "",
-        high_price=getattr(data, "h", "") or "",
-        low_price=getattr(data, "l", "") or "",
-        close_price=getattr(data, "c", "") or "",
-        weighted_avg_price=getattr(data, "w", "") or "",
-        total_traded_base_volume=getattr(data, "v", "") or "",
-        total_traded_quote_volume=getattr(data, "q", "") or "",
-        statistics_open_time=getattr(data, "O", 0) or 0,
-        statistics_close_time=getattr(data, "C", 0) or 0,
-        first_trade_id=getattr(data, "F", 0) or 0,
-        last_trade_id=getattr(data, "L", 0) or 0,
-        total_num_trades=getattr(data, "n", 0) or 0,
+        event_type=event_type or "",
+        event_time=event_time or 0,
+        symbol=symbol or "",
+        price_change=price_change or "",
+        price_change_percent=price_change_percent or "",
+        open_price=open_price or "",
+        high_price=high_price or "",
+        low_price=low_price or "",
+        close_price=close_price or "",
+        weighted_avg_price=weighted_avg_price or "",
+        total_traded_base_volume=total_traded_base_volume or "",
+        total_traded_quote_volume=total_traded_quote_volume or "",
+        statistics_open_time=statistics_open_time or 0,
+        statistics_close_time=statistics_close_time or 0,
+        first_trade_id=first_trade_id or 0,
+        last_trade_id=last_trade_id or 0,
+        total_num_trades=total_num_trades or 0,
     )
 
 
+def _make_dict_builder(cls: type, attrs: dict[str, str], getter: operator.attrgetter):
+    """Build a function that returns ``asdict(cls(...))`` without the dataclass.
+
+    ``attrs`` maps dataclass field → SDK attribute.  Key order and the
+    values of unmapped fields (e.g. ``stream_type``) come from
+    ``dataclasses.fields(cls)``, so the dicts follow the model definition.
+    """
+    template = {f.name: f.default for f in fields(cls)}
+    unknown = attrs.keys() - template.keys()
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no field(s) {sorted(unknown)}")
+    keys = tuple(attrs)
+    names = tuple(attrs.values())
+    defaults = tuple(template[key] for key in keys)
+
+    def to_dict(data) -> dict[str, Any]:
+        event = template.copy()
+        values = _get_fields(data, getter, names)
+        for key, value, default in zip(keys, values, defaults):
+            event[key] = value or default
+        return event
+
+    return to_dict
+
+
+_book_ticker_to_dict = _make_dict_builder(
+    BookTickerEvent, _BOOK_TICKER_ATTRS, _get_book_ticker_fields,
+)
+_rolling_window_ticker_to_dict = _make_dict_builder(
+    RollingWindowTickerEvent, _ROLLING_WINDOW_TICKER_ATTRS, _get_rolling_window_ticker_fields,
+)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Main client
 # ──────────────────────────────────────────────────────────────────────
@@ -95,8 +193,14 @@ class BinanceWebSocketClient:
         WebSocket stream base URL.  Defaults to ``wss://stream.binance.com:9443``.
     on_book_ticker : callable, optional
         ``async def callback(event: BookTickerEvent) -> None``
+        (``event: dict`` when ``emit="dict"``)
     on_rolling_window_ticker : callable, optional
         ``async def callback(event: RollingWindowTickerEvent) -> None``
+        (``event: dict`` when ``emit="dict"``)
+    emit : ``"event"`` or ``"dict"``
+        What the callbacks receive.  ``"dict"`` passes plain dicts with the
+        same keys as the event dataclasses, skipping their construction —
+        useful when the callback only serialises.  Defaults to ``"event"``.
     """
 
     # Map user-friendly window size strings → SDK enum values
@@ -111,14 +215,26 @@ class BinanceWebSocketClient:
         symbols: list[str],
         window_sizes: list[str] | None = None,
         stream_url: str = STREAM_URL,
-        on_book_ticker: Callable[[BookTickerEvent], Awaitable[None]] | None = None,
-        on_rolling_window_ticker: Callable[[RollingWindowTickerEvent], Awaitable[None]] | None = None,
+        on_book_ticker: (
+            Callable[[BookTickerEvent], Awaitable[None]]
+            | Callable[[dict[str, Any]], Awaitable[None]]
+            | None
+        ) = None,
+        on_rolling_window_ticker: (
+            Callable[[RollingWindowTickerEvent], Awaitable[None]]
+            | Callable[[dict[str, Any]], Awaitable[None]]
+            | None
+        ) = None,
+        emit: Literal["event", "dict"] = "event",
     ) -> None:
+        if emit not in ("event", "dict"):
+            raise ValueError(f"emit must be 'event' or 'dict', got {emit!r}")
         self._symbols = [s.lower() for s in symbols]
         self._window_sizes = window_sizes or ["1h"]
         self._stream_url = stream_url
         self._on_book_ticker = on_book_ticker
         self._on_rolling_window_ticker = on_rolling_window_ticker
+        self._emit_dicts = emit == "dict"
 
         # SDK client
         config = ConfigurationWebSocketStreams(stream_url=self._stream_url)
@@ -196,30 +312,56 @@ class BinanceWebSocketClient:
     # ----------------------------------------------------------------
 
     def _make_book_ticker_handler(self, symbol: str):
-        """Return a closure that processes book ticker messages."""
+        """Return a closure that processes book ticker messages.
+
+        Called from ``start()``, so the running loop's ``create_task`` and
+        the callback are bound once here rather than looked up per message.
+        """
+        create_task = asyncio.get_running_loop().create_task
+        callback = self._on_book_ticker
+        if self._emit_dicts:
+            parse = _book_ticker_to_dict
+            get_bid_ask = operator.itemgetter("bid_price", "ask_price")
+        else:
+            parse = _parse_book_ticker
+            get_bid_ask = operator.attrgetter("bid_price", "ask_price")
+        is_enabled_for = log.isEnabledFor
 
         def handler(data):
-            event = _parse_book_ticker(data)
-            log.debug("bookTicker %s: bid=%s ask=%s", symbol, event.bid_price, event.ask_price)
-            if self._on_book_ticker is not None:
+            event = parse(data)
+            if is_enabled_for(logging.DEBUG):
+                bid, ask = get_bid_ask(event)
+                log.debug("bookTicker %s: bid=%s ask=%s", symbol, bid, ask)
+            if callback is not None:
                 # Schedule the async callback
-                asyncio.ensure_future(self._on_book_ticker(event))
+                create_task(callback(event))
 
         return handler
 
     def _make_rolling_window_handler(self, symbol: str, window: str):
         """Return a closure that processes rolling window ticker messages."""
+        create_task = asyncio.get_running_loop().create_task
+        callback = self._on_rolling_window_ticker
+        if self._emit_dicts:
+            parse = _rolling_window_ticker_to_dict
+            get_close_volume = operator.itemgetter("close_price", "total_traded_base_volume")
+        else:
+            parse = _parse_rolling_window_ticker
+            get_close_volume = operator.attrgetter("close_price", "total_traded_base_volume")
+        is_enabled_for = log.isEnabledFor
 
         def handler(data):
-            event = _parse_rolling_window_ticker(data)
-            log.debug(
-                "ticker_%s %s: close=%s volume=%s",
-                window,
-                symbol,
-                event.close_price,
-                event.total_traded_base_volume,
-            )
-            if self._on_rolling_window_ticker is not None:
-                asyncio.ensure_future(self._on_rolling_window_ticker(event))
+            event = parse(data)
+            if is_enabled_for(logging.DEBUG):
+                close, volume = get_close_volume(event)
+                log.debug(
+                    "ticker_%s %s: close=%s volume=%s",
+                    window,
+                    symbol,
+                    close,
+                    volume,
+                )
+            if callback is not None:
+                create_task(callback(event))
 
         return handler
@@ -0,0 +1,121 @@
+"""Tests for the JSON stream decoder."""
+
+from __future__ import annotations
+
+import pytest
+
+from binance_sbe.decoder import (
+    _decode_book_ticker_fast,
+    _decode_json,
+    decode_json_message,
+    decode_json_messages,
+)
+from binance_sbe.models import BestBidAsk
+
+# Canonical combined-stream bookTicker frames, byte-for-byte as Binance sends them
+CANONICAL_FRAMES = [
+    b'{"stream":"bnbusdt@bookTicker","data":{"u":400900217,"s":"BNBUSDT",'
+    b'"b":"25.35190000","B":"31.21000000","a":"25.36520000","A":"40.66000000"}}',
+    b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTCUSDT",'
+    b'"b":"97500.01000000","B":"0.00100000","a":"97500.02000000","A":"1.50000000"}}',
+    b'{"stream":"1000satsusdt@bookTicker","data":{"u":0,"s":"1000SATSUSDT",'
+    b'"b":"0","B":"0.","a":"0.00000001","A":"123456789"}}',
+]
+
+# Valid bookTicker JSON the fast path must leave to the JSON parser
+FALL_THROUGH_FRAMES = {
+    "whitespace": b'{"stream": "btcusdt@bookTicker", "data": {"u": 1, "s": "BTCUSDT", '
+    b'"b": "1.0", "B": "2.0", "a": "3.0", "A": "4.0"}}',
+    "extra_key": b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTCUSDT",'
+    b'"b":"1.0","B":"2.0","a":"3.0","A":"4.0","E":1700000000000}}',
+    "reordered_keys": b'{"stream":"btcusdt@bookTicker","data":{"s":"BTCUSDT","u":1,'
+    b'"b":"1.0","B":"2.0","a":"3.0","A":"4.0"}}',
+    "escaped_symbol": b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTC\\u0055SDT",'
+    b'"b":"1.0","B":"2.0","a":"3.0","A":"4.0"}}',
+    "exponent_number": b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTCUSDT",'
+    b'"b":"1e-5","B":"2.0","a":"3.0","A":"4.0"}}',
+}
+
+MALFORMED_FRAMES = [
+    b"",
+    b"{",
+    b"not json",
+    b"\xff\xfe\x00",
+    b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTCUSDT",'
+    b'"b":"oops","B":"2.0","a":"3.0","A":"4.0"}}',
+    b'{"stream":"btcusdt@bookTicker","data":{"u":1,"s":"BTCUSDT",'
+    b'"b":"1.0","B":"2.0","a":"3.0","A":"4.0"}',
+]
+
+
+@pytest.mark.parametrize("frame", CANONICAL_FRAMES)
+def test_fast_path_matches_json_path(frame):
+    fast = _decode_book_ticker_fast(frame)
+    assert fast is not None
+    assert fast == _decode_json(frame)
+    assert decode_json_message(frame) == fast
+
+
+def test_canonical_frame_fields():
+    event = decode_json_message(CANONICAL_FRAMES[0])
+    assert event == BestBidAsk(
+        stream_type="bookTicker",
+        symbol="BNBUSDT",
+        order_book_update_id=400900217,
+        bid_price=25.3519,
+        bid_qty=31.21,
+        ask_price=25.3652,
+        ask_qty=40.66,
+    )
+
+
+@pytest.mark.parametrize("frame", FALL_THROUGH_FRAMES.values(), ids=FALL_THROUGH_FRAMES.keys())
+def test_fast_path_falls_through_to_json(frame):
+    assert _decode_book_ticker_fast(frame) is None
+    event = decode_json_message(frame)
+    assert event is not None
+    assert event == _decode_json(frame)
+
+
+def test_escaped_symbol_is_unescaped():
+    event = decode_json_message(FALL_THROUGH_FRAMES["escaped_symbol"])
+    assert event.symbol == "BTCUSDT"
+
+
+def test_exponent_number_is_parsed():
+    event = decode_json_message(FALL_THROUGH_FRAMES["exponent_number"])
+    assert event.bid_price == 1e-5
+
+
+@pytest.mark.parametrize("frame", CANONICAL_FRAMES)
+def test_str_input_matches_bytes_input(frame):
+    assert decode_json_message(frame.decode()) == decode_json_message(frame)
+
+
+@pytest.mark.parametrize("frame", MALFORMED_FRAMES)
+def test_malformed_frame_returns_none(frame):
+    assert _decode_book_ticker_fast(frame) is None
+    assert decode_json_message(frame) is None
+
+
+def test_unknown_stream_returns_none():
+    frame = b'{"stream":"btcusdt@trade","data":{"e":"trade"}}'
+    assert decode_json_message(frame) is None
+
+
+def test_decode_json_messages_matches_per_frame_decode():
+    frames = [
+        CANONICAL_FRAMES[0],
+        CANONICAL_FRAMES[1].decode(),
+        *MALFORMED_FRAMES,
+        FALL_THROUGH_FRAMES["whitespace"],
+        FALL_THROUGH_FRAMES["escaped_symbol"].decode(),
+        "not json",
+        b'{"stream":"btcusdt@trade","data":{"e":"trade"}}',
+        CANONICAL_FRAMES[2],
+    ]
+    expected = [e for f in frames if (e := decode_json_message(f))]
+    assert len(expected) == 5
+    assert decode_json_messages(frames) == expected
+    assert decode_json_messages(iter(frames)) == expected
+    assert decode_json_messages([]) == []
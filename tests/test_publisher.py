@@ -0,0 +1,118 @@
+"""Tests for the UDS publisher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+
+import pytest
+import structlog
+
+from binance_sbe.config import PublisherConfig
+from binance_sbe.publisher import Publisher
+
+_LEN = struct.Struct(">I")
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    """Yield to the loop until ``predicate()`` holds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.001)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> dict:
+    (length,) = _LEN.unpack(await asyncio.wait_for(reader.readexactly(_LEN.size), 2.0))
+    return json.loads(await asyncio.wait_for(reader.readexactly(length), 2.0))
+
+
+@pytest.fixture
+async def make_publisher(tmp_path):
+    """Start publishers on a temporary socket path; stop them afterwards."""
+    publishers: list[Publisher] = []
+
+    async def factory(**kwargs) -> Publisher:
+        publisher = Publisher(PublisherConfig(uds_path=str(tmp_path / "p.sock"), **kwargs))
+        await publisher.start()
+        publishers.append(publisher)
+        return publisher
+
+    yield factory
+    for publisher in publishers:
+        await publisher.stop()
+
+
+async def _connect(publisher: Publisher, uds_path: str):
+    reader, writer = await asyncio.open_unix_connection(uds_path)
+    await _wait_for(lambda: len(publisher._clients) == 1)
+    return reader, writer
+
+
+async def test_frames_arrive_in_order(make_publisher):
+    publisher = await make_publisher()
+    reader, writer = await _connect(publisher, publisher._uds_path)
+
+    for i in range(500):
+        await publisher.publish({"seq": i})
+    received = [(await _read_frame(reader))["seq"] for _ in range(500)]
+    assert received == list(range(500))
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_overflow_logs_one_warning_pair_per_episode(make_publisher):
+    publisher = await make_publisher(max_queue_size=2)
+    reader, writer = await _connect(publisher, publisher._uds_path)
+
+    with structlog.testing.capture_logs() as logs:
+        for episode in range(2):
+            # publish() never yields, so the writer cannot drain mid-burst:
+            # the first two frames are queued and the rest are dropped.
+            for i in range(10):
+                await publisher.publish({"episode": episode, "seq": i})
+            assert [(await _read_frame(reader))["seq"] for _ in range(2)] == [0, 1]
+            await _wait_for(lambda: publisher._client_list[0].dropped == 0)
+
+    overflow = [
+        entry for entry in logs
+        if entry["event"] in ("publisher.client_queue_full", "publisher.client_queue_drained")
+    ]
+    client_id = publisher._client_list[0].id
+    assert [(entry["event"], entry["client"]) for entry in overflow] == [
+        ("publisher.client_queue_full", client_id),
+        ("publisher.client_queue_drained", client_id),
+    ] * 2
+    assert [entry["dropped"] for entry in overflow[1::2]] == [8, 8]
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test_disconnect_removes_client_state(make_publisher):
+    publisher = await make_publisher()
+    reader, writer = await _connect(publisher, publisher._uds_path)
+    assert len(publisher._client_list) == 1
+    assert len(publisher._writer_tasks) == 1
+    task = next(iter(publisher._writer_tasks.values()))
+
+    writer.close()
+    await writer.wait_closed()
+    await _wait_for(lambda: not publisher._writer_tasks)
+
+    assert publisher._clients == {}
+    assert publisher._client_list == ()
+    await _wait_for(task.done)
+    assert task.cancelled()
+    # Publishing with no clients is a no-op
+    await publisher.publish({"seq": 0})
+
+
+@pytest.mark.parametrize("max_queue_size", [0, -1])
+def test_non_positive_queue_size_is_rejected(max_queue_size):
+    with pytest.raises(ValueError, match="max_queue_size"):
+        Publisher(PublisherConfig(uds_path="/tmp/unused.sock", max_queue_size=max_queue_size))
@@ -0,0 +1,66 @@
+"""Tests for the SDK stream helpers in ``binance_sdk.websocket_streams``."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("binance_sdk_spot")
+
+from binance_sdk.websocket_streams import (  # noqa: E402
+    BinanceWebSocketClient,
+    _book_ticker_to_dict,
+    _parse_book_ticker,
+    _parse_rolling_window_ticker,
+    _rolling_window_ticker_to_dict,
+)
+
+BOOK_TICKER_MESSAGES = {
+    "full": SimpleNamespace(
+        u=400900217, s="BNBUSDT", b="25.35190000", B="31.21000000",
+        a="25.36520000", A="40.66000000",
+    ),
+    "none_values": SimpleNamespace(u=None, s=None, b=None, B=None, a=None, A=None),
+    "missing_attrs": SimpleNamespace(u=1, s="BTCUSDT"),
+    "empty": SimpleNamespace(),
+}
+
+ROLLING_WINDOW_TICKER_MESSAGES = {
+    "full": SimpleNamespace(
+        e="1hTicker", E=1672515782136, s="BNBBTC", p="0.0015", P="250.00",
+        o="0.0010", h="0.0025", l="0.0010", c="0.0025", w="0.0018",
+        v="10000", q="18", O=0, C=1672515782136, F=0, L=18150, n=18151,
+    ),
+    "none_values": SimpleNamespace(
+        **{name: None for name in "e E s p P o h l c w v q O C F L n".split()}
+    ),
+    "missing_attrs": SimpleNamespace(s="BNBBTC", c="0.0025"),
+    "empty": SimpleNamespace(),
+}
+
+
+@pytest.mark.parametrize(
+    "message", BOOK_TICKER_MESSAGES.values(), ids=BOOK_TICKER_MESSAGES.keys(),
+)
+def test_book_ticker_dict_matches_event(message):
+    expected = asdict(_parse_book_ticker(message))
+    result = _book_ticker_to_dict(message)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "message", ROLLING_WINDOW_TICKER_MESSAGES.values(), ids=ROLLING_WINDOW_TICKER_MESSAGES.keys(),
+)
+def test_rolling_window_ticker_dict_matches_event(message):
+    expected = asdict(_parse_rolling_window_ticker(message))
+    result = _rolling_window_ticker_to_dict(message)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_unknown_emit_mode_is_rejected():
+    with pytest.raises(ValueError, match="emit"):
+        BinanceWebSocketClient(symbols=["btcusdt"], emit="dicts")